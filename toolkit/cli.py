@@ -3,7 +3,7 @@ import argparse
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Optional, Tuple
 
 from .utils import ensure_dir, parse_csv_list, validate_file
 from .system_health import collect_health_snapshot, HealthSnapshot
@@ -15,39 +15,62 @@ def _print_header(title: str) -> None:
     print(title)
     print("=" * 72)
 
-def _print_summary(snapshot: Optional[HealthSnapshot], log_result: Optional[LogParseResult]) -> Dict[str, str]:
-    summary: Dict[str, str] = {}
-    summary["generated_at"] = datetime.now().isoformat(timespec="seconds")
+def _print_snapshot(snap: HealthSnapshot, show_services: bool) -> bool:
+    # prints the snapshot and, in the same pass over the disks, computes the
+    # disk health flag so _summary_rows does not iterate them a second time
+    print(f"Time      : {snap.timestamp}")
+    print(f"Host      : {snap.hostname}")
+    print(f"OS        : {snap.os} {snap.os_version}")
+    print(f"CPU       : cores={snap.cpu.cores_logical or 'N/A'} load={snap.cpu.load_percent or 'N/A'}%")
+    print(f"Memory    : total={snap.memory.total_gb or 'N/A'}GB used={snap.memory.used_gb or 'N/A'}GB ({snap.memory.used_percent or 'N/A'}%)")
+    print("Disks     :")
+    disk_high = False
+    for d in snap.disks:
+        if d.used_percent is not None and d.used_percent >= 90:
+            disk_high = True
+        print(f"  - {d.mount} total={d.total_gb or 'N/A'}GB used={d.used_gb or 'N/A'}GB ({d.used_percent or 'N/A'}%) free={d.free_gb or 'N/A'}GB")
+    if show_services:
+        print("Services  :")
+        for s in snap.services:
+            print(f"  - {s.name}: {s.status} {('(' + s.detail + ')') if s.detail else ''}")
+    return disk_high
 
-    if snapshot is not None:
-        summary["hostname"] = snapshot.hostname
-        summary["os"] = f"{snapshot.os} {snapshot.os_version}"
-        summary["memory_used_percent"] = f"{snapshot.memory.used_percent}%" if snapshot.memory.used_percent is not None else "N/A"
-        summary["disk_count"] = str(len(snapshot.disks))
-        summary["service_checked"] = str(len(snapshot.services))
+def _summary_rows(snapshot: Optional[HealthSnapshot], log_result: Optional[LogParseResult], *, disk_high: Optional[bool] = None) -> List[Tuple[str, str]]:
+    # ordered (key, value) rows, appended once and streamed as-is to the
+    # exporters: no dict hashing and no second formatting pass
+    rows: List[Tuple[str, str]] = []
+    rows.append(("generated_at", datetime.now().isoformat(timespec="seconds")))
 
-        disk_high = any((d.used_percent is not None and d.used_percent >= 90) for d in snapshot.disks)
+    if snapshot is not None:
+        rows.append(("hostname", snapshot.hostname))
+        rows.append(("os", f"{snapshot.os} {snapshot.os_version}"))
+        rows.append(("memory_used_percent", f"{snapshot.memory.used_percent}%" if snapshot.memory.used_percent is not None else "N/A"))
+        rows.append(("disk_count", str(len(snapshot.disks))))
+        rows.append(("service_checked", str(len(snapshot.services))))
+
+        if disk_high is None:
+            disk_high = any((d.used_percent is not None and d.used_percent >= 90) for d in snapshot.disks)
         mem_high = (snapshot.memory.used_percent is not None and snapshot.memory.used_percent >= 90)
         cpu_high = (snapshot.cpu.load_percent is not None and snapshot.cpu.load_percent >= 90)
-        summary["health_flag_disk_90"] = "YES" if disk_high else "NO"
-        summary["health_flag_mem_90"] = "YES" if mem_high else "NO"
-        summary["health_flag_cpu_90"] = "YES" if cpu_high else "NO"
+        rows.append(("health_flag_disk_90", "YES" if disk_high else "NO"))
+        rows.append(("health_flag_mem_90", "YES" if mem_high else "NO"))
+        rows.append(("health_flag_cpu_90", "YES" if cpu_high else "NO"))
 
     if log_result is not None:
-        summary["log_file"] = log_result.file
-        summary["log_total_lines"] = str(log_result.total_lines)
-        summary["log_matched_lines"] = str(log_result.matched_lines)
+        rows.append(("log_file", log_result.file))
+        rows.append(("log_total_lines", str(log_result.total_lines)))
+        rows.append(("log_matched_lines", str(log_result.matched_lines)))
         if log_result.by_keyword:
             kw, c = max(log_result.by_keyword.items(), key=lambda x: x[1])
-            summary["log_top_keyword"] = kw
-            summary["log_top_keyword_count"] = str(c)
+            rows.append(("log_top_keyword", kw))
+            rows.append(("log_top_keyword_count", str(c)))
 
-    return summary
+    return rows
 
 def _export(
     export_format: str,
     out_dir: Path,
-    summary: Dict[str, str],
+    summary: List[Tuple[str, str]],
     snapshot: Optional[HealthSnapshot],
     log_result: Optional[LogParseResult],
 ) -> List[Path]:
@@ -72,21 +95,9 @@ def cmd_health(args: argparse.Namespace) -> int:
     _print_header("SYSTEM HEALTH CHECK")
     snap = collect_health_snapshot(services)
 
-    print(f"Time      : {snap.timestamp}")
-    print(f"Host      : {snap.hostname}")
-    print(f"OS        : {snap.os} {snap.os_version}")
-    print(f"CPU       : cores={snap.cpu.cores_logical or 'N/A'} load={snap.cpu.load_percent or 'N/A'}%")
-    print(f"Memory    : total={snap.memory.total_gb or 'N/A'}GB used={snap.memory.used_gb or 'N/A'}GB ({snap.memory.used_percent or 'N/A'}%)")
-    print("Disks     :")
-    for d in snap.disks:
-        print(f"  - {d.mount} total={d.total_gb or 'N/A'}GB used={d.used_gb or 'N/A'}GB ({d.used_percent or 'N/A'}%) free={d.free_gb or 'N/A'}GB")
-
-    if services:
-        print("Services  :")
-        for s in snap.services:
-            print(f"  - {s.name}: {s.status} {('(' + s.detail + ')') if s.detail else ''}")
+    disk_high = _print_snapshot(snap, bool(services))
 
-    summary = _print_summary(snap, None)
+    summary = _summary_rows(snap, None, disk_high=disk_high)
     created = _export(args.export, Path(args.out), summary, snap, None)
 
     print("\nExported:")
@@ -117,7 +128,7 @@ def cmd_parse_log(args: argparse.Namespace) -> int:
         for s in result.samples[:10]:
             print(f"  [{s.line_no}] ({s.keyword}) {s.line}")
 
-    summary = _print_summary(None, result)
+    summary = _summary_rows(None, result)
     created = _export(args.export, Path(args.out), summary, None, result)
 
     print("\nExported:")
@@ -139,22 +150,10 @@ def cmd_run(args: argparse.Namespace) -> int:
         print(f"WARNING: log parse failed ({e}); continuing with system health only.")
         log_result = None
 
-    summary = _print_summary(snap, log_result)
-    created = _export(args.export, Path(args.out), summary, snap, log_result)
+    disk_high = _print_snapshot(snap, bool(services))
 
-    print(f"Time      : {snap.timestamp}")
-    print(f"Host      : {snap.hostname}")
-    print(f"OS        : {snap.os} {snap.os_version}")
-    print(f"CPU       : cores={snap.cpu.cores_logical or 'N/A'} load={snap.cpu.load_percent or 'N/A'}%")
-    print(f"Memory    : total={snap.memory.total_gb or 'N/A'}GB used={snap.memory.used_gb or 'N/A'}GB ({snap.memory.used_percent or 'N/A'}%)")
-    print("Disks     :")
-    for d in snap.disks:
-        print(f"  - {d.mount} total={d.total_gb or 'N/A'}GB used={d.used_gb or 'N/A'}GB ({d.used_percent or 'N/A'}%) free={d.free_gb or 'N/A'}GB")
-
-    if services:
-        print("Services  :")
-        for s in snap.services:
-            print(f"  - {s.name}: {s.status} {('(' + s.detail + ')') if s.detail else ''}")
+    summary = _summary_rows(snap, log_result, disk_high=disk_high)
+    created = _export(args.export, Path(args.out), summary, snap, log_result)
 
     if log_result is not None:
         print("\nLog Summary:")
@@ -1,8 +1,42 @@
 from __future__ import annotations
+import bisect
+import hashlib
+import json
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .utils import cache_dir
+
+try:
+    import hyperscan  # type: ignore
+except Exception:
+    hyperscan = None  # type: ignore
+
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    np = None  # type: ignore
+
+try:
+    from numba import njit  # type: ignore
+except Exception:
+    njit = None  # type: ignore
+
+try:
+    import ahocorasick  # type: ignore
+except Exception:
+    ahocorasick = None  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
 
 @dataclass
 class LogFinding:
@@ -18,6 +52,290 @@ class LogParseResult:
     by_keyword: Dict[str, int]
     samples: List[LogFinding]
 
+# 1 MiB blocks for the non-mmap read path
+_READ_BLOCK = 1 << 20
+
+def _read_buffer(log_path: Path):
+    with log_path.open("rb", buffering=_READ_BLOCK) as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # empty file or non-regular file: read in large blocks instead
+            data = bytearray()
+            while True:
+                block = f.read(_READ_BLOCK)
+                if not block:
+                    break
+                data += block
+            return bytes(data)
+
+def _newline_offsets(buf) -> Sequence[int]:
+    if np is not None:
+        return np.flatnonzero(np.frombuffer(buf, dtype=np.uint8) == 0x0A)
+    offsets: List[int] = []
+    pos = buf.find(b"\n")
+    while pos != -1:
+        offsets.append(pos)
+        pos = buf.find(b"\n", pos + 1)
+    return offsets
+
+def _count_lines(buf) -> int:
+    if np is not None:
+        n = int(np.count_nonzero(np.frombuffer(buf, dtype=np.uint8) == 0x0A))
+    else:
+        n = len(_newline_offsets(buf))
+    return n + (1 if len(buf) and buf[-1:] != b"\n" else 0)
+
+def _keyword_occurrences(data: bytes, kw_bytes: List[bytes]) -> List[int]:
+    # bytes.count runs as a single C-level scan; the result is an upper bound
+    # on per-line counts, good enough to skip keywords that cannot match
+    return [data.count(kw) for kw in kw_bytes]
+
+def _line_text(buf, newlines: Sequence[int], line_no: int, max_line_length: int) -> str:
+    start = 0 if line_no == 1 else newlines[line_no - 2] + 1
+    end = newlines[line_no - 1] + 1 if line_no - 1 < len(newlines) else len(buf)
+    line = buf[start:end].decode("utf-8", errors="replace")
+    if len(line) > max_line_length:
+        line = line[:max_line_length] + "…(truncated)"
+    # \r\n: the old text-mode reader translated it away; strip it here too
+    return line.rstrip("\r\n")
+
+@lru_cache(maxsize=64)
+def _hyperscan_db(kw_bytes: Tuple[bytes, ...]):
+    # data and keywords arrive already case-folded, so the database does
+    # plain literal matching; no HS_FLAG_CASELESS needed
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(kw.decode("utf-8", errors="replace")).encode("utf-8") for kw in kw_bytes],
+        ids=list(range(len(kw_bytes))),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(kw_bytes),
+    )
+    return db
+
+def _scan_hyperscan(data: bytes, kw_bytes: List[bytes]) -> List[Tuple[int, int]]:
+    db = _hyperscan_db(tuple(kw_bytes))
+    hits: List[Tuple[int, int]] = []
+
+    def on_match(kw_id: int, start: int, end: int, match_flags: int, ctx) -> None:
+        hits.append((start, kw_id))
+
+    db.scan(data, match_event_handler=on_match)
+    return hits
+
+if njit is not None and np is not None:
+    @njit(cache=True, boundscheck=False)
+    def _scan_kernel(data, kw_data, kw_offsets, kw_lens, out_offsets, out_ids):  # pragma: no cover
+        n = data.shape[0]
+        count = 0
+        for k in range(kw_lens.shape[0]):
+            base = kw_offsets[k]
+            klen = kw_lens[k]
+            first = kw_data[base]
+            i = 0
+            while i + klen <= n:
+                if data[i] == first:
+                    j = 1
+                    while j < klen and data[i + j] == kw_data[base + j]:
+                        j += 1
+                    if j == klen:
+                        out_offsets[count] = i
+                        out_ids[count] = k
+                        count += 1
+                        # skip the matched span: bytes.count (which sized the
+                        # output arrays) counts non-overlapping occurrences,
+                        # so a self-overlapping keyword must not record more
+                        # hits than that; overlaps land on the same line and
+                        # collapse away anyway
+                        i += klen
+                        continue
+                i += 1
+        return count
+else:
+    _scan_kernel = None  # type: ignore
+
+@lru_cache(maxsize=64)
+def _packed_keywords(kw_bytes: Tuple[bytes, ...]):
+    kw_data = np.frombuffer(b"".join(kw_bytes), dtype=np.uint8)
+    kw_lens = np.array([len(kw) for kw in kw_bytes], dtype=np.int64)
+    kw_offsets = np.concatenate((np.zeros(1, dtype=np.int64), np.cumsum(kw_lens)[:-1]))
+    return kw_data, kw_offsets, kw_lens
+
+def _scan_numba(data: bytes, kw_bytes: List[bytes], capacity: Optional[int] = None) -> List[Tuple[int, int]]:
+    # the serial path passes the prefilter's occurrence total so the kernel
+    # does not repeat that counting pass; per-chunk callers self-size, since
+    # the parent's whole-file counts do not apply to a chunk
+    if capacity is None:
+        capacity = sum(_keyword_occurrences(data, kw_bytes))
+    if not capacity:
+        return []
+    kw_data, kw_offsets, kw_lens = _packed_keywords(tuple(kw_bytes))
+    out_offsets = np.empty(capacity, dtype=np.int64)
+    out_ids = np.empty(capacity, dtype=np.int64)
+    count = _scan_kernel(np.frombuffer(data, dtype=np.uint8), kw_data, kw_offsets, kw_lens, out_offsets, out_ids)
+    return [(int(out_offsets[i]), int(out_ids[i])) for i in range(count)]
+
+@lru_cache(maxsize=64)
+def _ac_automaton(kw_bytes: Tuple[bytes, ...]):
+    groups: Dict[bytes, List[int]] = {}
+    for idx, kw in enumerate(kw_bytes):
+        groups.setdefault(kw, []).append(idx)
+    automaton = ahocorasick.Automaton()
+    for kw, ids in groups.items():
+        automaton.add_word(kw.decode("latin-1"), (len(kw), ids))
+    automaton.make_automaton()
+    return automaton
+
+# the automaton needs a str haystack, and that decode (plus pyahocorasick's
+# internal widening) costs several times the input; feed it bounded windows
+_AC_WINDOW_BYTES = 4 << 20
+
+def _scan_ahocorasick(data: bytes, kw_bytes: List[bytes]) -> List[Tuple[int, int]]:
+    # latin-1 keeps a 1:1 byte/char mapping, so automaton offsets stay byte offsets
+    automaton = _ac_automaton(tuple(kw_bytes))
+    hits: List[Tuple[int, int]] = []
+    n = len(data)
+    # each window extends maxlen-1 bytes past its end so matches straddling a
+    # cut are seen whole; a match starting in the extension belongs to (and is
+    # only recorded by) the next window
+    overlap = max(len(kw) for kw in kw_bytes) - 1
+    start = 0
+    while start < n:
+        stop = min(n, start + _AC_WINDOW_BYTES)
+        window = data[start:min(n, stop + overlap)].decode("latin-1")
+        for end, (klen, ids) in automaton.iter(window):
+            offset = start + end - klen + 1
+            if offset < stop:
+                for idx in ids:
+                    hits.append((offset, idx))
+        start = stop
+    return hits
+
+@lru_cache(maxsize=64)
+def _compiled_patterns(kw_bytes: Tuple[bytes, ...]):
+    return tuple(re.compile(re.escape(kw)) for kw in kw_bytes)
+
+def _scan_regex(data: bytes, kw_bytes: List[bytes]) -> List[Tuple[int, int]]:
+    # whole-buffer finditer per keyword: still C-level scans, and unlike a single
+    # alternation it cannot swallow overlapping matches of different keywords
+    hits: List[Tuple[int, int]] = []
+    for idx, rx in enumerate(_compiled_patterns(tuple(kw_bytes))):
+        for m in rx.finditer(data):
+            hits.append((m.start(), idx))
+    return hits
+
+# small files parse in microseconds; caching them is pure directory churn
+_CACHE_MIN_BYTES = 1 << 20
+# LRU budget: mtime+size keys mean rotated logs keep minting new entries
+_CACHE_MAX_ENTRIES = 64
+
+def _cache_dir() -> Path:
+    return cache_dir("log_parser")
+
+def _cache_path(log_path: Path, keywords: List[str], case_insensitive: bool,
+                max_samples: int, max_line_length: int) -> Optional[Path]:
+    st = log_path.stat()
+    if st.st_size < _CACHE_MIN_BYTES:
+        return None
+    # mtime+size in the key means an updated log simply misses the old entry
+    key = repr((
+        str(log_path.resolve()), st.st_mtime_ns, st.st_size,
+        tuple(keywords), case_insensitive, max_samples, max_line_length,
+    ))
+    return _cache_dir() / (hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+def _cache_trim(directory: Path, max_entries: int = _CACHE_MAX_ENTRIES) -> None:
+    try:
+        entries = sorted(directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:max(0, len(entries) - max_entries)]:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+    except Exception:
+        pass
+
+def _cache_load(cache_file: Path):
+    try:
+        raw = cache_file.read_bytes()
+        obj = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        os.utime(cache_file)  # mark recently used for the LRU trim
+        return LogParseResult(
+            file=obj["file"],
+            total_lines=obj["total_lines"],
+            matched_lines=obj["matched_lines"],
+            by_keyword=dict(obj["by_keyword"]),
+            samples=[LogFinding(**s) for s in obj["samples"]],
+        )
+    except Exception:
+        return None
+
+def _cache_store(cache_file: Path, result: LogParseResult) -> None:
+    try:
+        payload = {
+            "file": result.file,
+            "total_lines": result.total_lines,
+            "matched_lines": result.matched_lines,
+            "by_keyword": result.by_keyword,
+            "samples": [{"line_no": s.line_no, "keyword": s.keyword, "line": s.line} for s in result.samples],
+        }
+        data = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(cache_file)
+        _cache_trim(cache_file.parent)
+    except Exception:
+        pass
+
+def _scan_buffer(data: bytes, kw_bytes: List[bytes], capacity: Optional[int] = None) -> List[Tuple[int, int]]:
+    # data and kw_bytes arrive already case-folded (see _parse_log_file), so
+    # every tier exact-matches against the one materialized buffer; capacity
+    # is the prefilter's occurrence total, used only by the numba tier
+    if hyperscan is not None:
+        return _scan_hyperscan(data, kw_bytes)
+    if ahocorasick is not None:
+        return _scan_ahocorasick(data, kw_bytes)
+    if _scan_kernel is not None:
+        return _scan_numba(data, kw_bytes, capacity)
+    return _scan_regex(data, kw_bytes)
+
+# files below this size are scanned in-process; above it, chunked workers win
+_PARALLEL_MIN_BYTES = 8 << 20
+_PARALLEL_MAX_WORKERS = 8
+
+def _scan_chunk(args) -> List[Tuple[int, int]]:
+    path_str, start, end, kw_bytes, case_insensitive = args
+    with open(path_str, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        chunk = mm[start:end]
+    if case_insensitive:
+        chunk = chunk.lower()  # the parent folded kw_bytes already
+    return [(offset + start, kw_id) for offset, kw_id in _scan_buffer(chunk, kw_bytes)]
+
+def _scan_parallel(log_path: Path, data: bytes, kw_bytes: List[bytes], case_insensitive: bool) -> List[Tuple[int, int]]:
+    n = len(data)
+    workers = min(os.cpu_count() or 1, _PARALLEL_MAX_WORKERS)
+    # split near-even byte ranges, then push each cut to the next newline so
+    # no line (and therefore no keyword) straddles two chunks
+    bounds = [0]
+    for i in range(1, workers):
+        cut = data.find(b"\n", n * i // workers)
+        cut = n if cut == -1 else cut + 1
+        if cut > bounds[-1]:
+            bounds.append(cut)
+    if bounds[-1] < n:
+        bounds.append(n)
+    ranges = list(zip(bounds, bounds[1:]))
+    if len(ranges) < 2:
+        return _scan_buffer(data, kw_bytes)
+    tasks = [(str(log_path), s, e, kw_bytes, case_insensitive) for s, e in ranges]
+    with ProcessPoolExecutor(max_workers=len(ranges)) as ex:
+        parts = list(ex.map(_scan_chunk, tasks))
+    hits: List[Tuple[int, int]] = []
+    for part in parts:
+        hits.extend(part)
+    return hits
+
 def parse_log_file(
     log_path: Path,
     keywords: List[str],
@@ -25,38 +343,195 @@ def parse_log_file(
     case_insensitive: bool = True,
     max_samples: int = 50,
     max_line_length: int = 5000,
+    use_cache: bool = True,
 ) -> LogParseResult:
+    """Count keyword hits per line and collect up to max_samples sample lines.
+
+    Matching considers the whole line: unlike the historical line-by-line
+    scanner, which truncated each line to max_line_length before searching,
+    a keyword appearing past the cutoff still counts, and truncation only
+    applies to the sample text stored in the result. Case-insensitive
+    matching folds ASCII for all-ASCII keyword lists; lists containing
+    non-ASCII characters are folded at str level (str.lower). Lines are
+    split on \\n only — the \\r of a \\r\\n pair is stripped from stored
+    samples, but lone-\\r (classic Mac) endings no longer delimit lines
+    the way the text-mode reader's universal newlines did.
+    """
     if not keywords:
         keywords = ["error"]
 
-    flags = re.IGNORECASE if case_insensitive else 0
-    patterns = [(kw, re.compile(re.escape(kw), flags)) for kw in keywords]
+    cache_file = None
+    if use_cache:
+        try:
+            cache_file = _cache_path(log_path, keywords, case_insensitive, max_samples, max_line_length)
+        except OSError:
+            cache_file = None
+    if cache_file is not None:
+        cached = _cache_load(cache_file)
+        if cached is not None:
+            return cached
+
+    result = _parse_log_file(
+        log_path, keywords,
+        case_insensitive=case_insensitive,
+        max_samples=max_samples,
+        max_line_length=max_line_length,
+    )
+    if cache_file is not None:
+        _cache_store(cache_file, result)
+    return result
+
+def _collapse_hits(
+    file: str,
+    total: int,
+    hits: List[Tuple[int, int]],
+    newlines: Sequence[int],
+    keywords: List[str],
+    max_samples: int,
+    line_text,
+) -> LogParseResult:
+    # collapse offset-level hits back to the per-line semantics of the old
+    # scanner: each keyword counts at most once per line
+    by_line: Dict[int, set] = {}
+    for offset, kw_id in hits:
+        line_no = bisect.bisect_left(newlines, offset) + 1
+        by_line.setdefault(line_no, set()).add(kw_id)
 
-    total = 0
-    matched = 0
     by_kw: Dict[str, int] = {kw: 0 for kw in keywords}
     samples: List[LogFinding] = []
-
-    with log_path.open("r", encoding="utf-8", errors="replace") as f:
-        for idx, line in enumerate(f, start=1):
-            total += 1
-            if len(line) > max_line_length:
-                line = line[:max_line_length] + "…(truncated)"
-
-            hit_any = False
-            for kw, rx in patterns:
-                if rx.search(line):
-                    by_kw[kw] = by_kw.get(kw, 0) + 1
-                    if len(samples) < max_samples:
-                        samples.append(LogFinding(line_no=idx, keyword=kw, line=line.rstrip("\n")))
-                    hit_any = True
-            if hit_any:
-                matched += 1
+    remaining = max_samples
+    for line_no in sorted(by_line):
+        # extract the line once per line, and only while still capturing;
+        # after the quota is filled the loop just tallies counts
+        text = line_text(line_no) if remaining > 0 else ""
+        for kw_id in sorted(by_line[line_no]):
+            by_kw[keywords[kw_id]] += 1
+            if remaining > 0:
+                samples.append(LogFinding(line_no=line_no, keyword=keywords[kw_id], line=text))
+                remaining -= 1
 
     return LogParseResult(
-        file=str(log_path),
+        file=file,
         total_lines=total,
-        matched_lines=matched,
+        matched_lines=len(by_line),
         by_keyword=by_kw,
         samples=samples,
     )
+
+def _parse_str(log_path: Path, buf, keywords: List[str], max_samples: int, max_line_length: int) -> LogParseResult:
+    # str-level fold for keyword lists containing non-ASCII: the byte
+    # scanners (bytes.lower, Hyperscan caseless, latin-1 automaton) fold
+    # ASCII only, but the historical re.IGNORECASE behaviour folds Unicode
+    text = bytes(buf).decode("utf-8", errors="replace")
+    low = text.lower()
+    if len(low) != len(text):
+        # lowering shifted offsets (rare one-to-many case mappings):
+        # match line by line instead of translating buffer offsets
+        return _parse_str_lines(str(log_path), text, keywords, max_samples, max_line_length)
+
+    newlines: List[int] = []
+    pos = low.find("\n")
+    while pos != -1:
+        newlines.append(pos)
+        pos = low.find("\n", pos + 1)
+    total = len(newlines) + (1 if text and not text.endswith("\n") else 0)
+
+    hits: List[Tuple[int, int]] = []
+    for idx, kw in enumerate(keywords):
+        kw_low = kw.lower()
+        start = low.find(kw_low)
+        while start != -1:
+            hits.append((start, idx))
+            start = low.find(kw_low, start + 1)
+
+    def line_text(line_no: int) -> str:
+        s = 0 if line_no == 1 else newlines[line_no - 2] + 1
+        e = newlines[line_no - 1] + 1 if line_no - 1 < len(newlines) else len(text)
+        line = text[s:e]
+        if len(line) > max_line_length:
+            line = line[:max_line_length] + "…(truncated)"
+        return line.rstrip("\r\n")
+
+    return _collapse_hits(str(log_path), total, hits, newlines, keywords, max_samples, line_text)
+
+def _parse_str_lines(file: str, text: str, keywords: List[str], max_samples: int, max_line_length: int) -> LogParseResult:
+    patterns = [(kw, re.compile(re.escape(kw), re.IGNORECASE)) for kw in keywords]
+    lines = text.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
+    total = 0
+    matched = 0
+    by_kw: Dict[str, int] = {kw: 0 for kw in keywords}
+    samples: List[LogFinding] = []
+    for idx, line in enumerate(lines, start=1):
+        line = line.rstrip("\r\n")
+        total += 1
+        hit_any = False
+        for kw, rx in patterns:
+            if rx.search(line):
+                by_kw[kw] += 1
+                if len(samples) < max_samples:
+                    s = line if len(line) <= max_line_length else line[:max_line_length] + "…(truncated)"
+                    samples.append(LogFinding(line_no=idx, keyword=kw, line=s))
+                hit_any = True
+        if hit_any:
+            matched += 1
+    return LogParseResult(file=file, total_lines=total, matched_lines=matched, by_keyword=by_kw, samples=samples)
+
+def _parse_log_file(
+    log_path: Path,
+    keywords: List[str],
+    *,
+    case_insensitive: bool,
+    max_samples: int,
+    max_line_length: int,
+) -> LogParseResult:
+    buf = _read_buffer(log_path)
+    if case_insensitive and any(ord(ch) > 127 for kw in keywords for ch in kw):
+        return _parse_str(log_path, buf, keywords, max_samples, max_line_length)
+
+    kw_bytes = [kw.encode("utf-8") for kw in keywords]
+    by_kw: Dict[str, int] = {kw: 0 for kw in keywords}
+
+    # the prefilter and every scan tier want real bytes (mmap has no count),
+    # so materialize — and fold — the buffer exactly once here; buf itself
+    # stays mapped for newline offsets and sample extraction
+    data = bytes(buf)
+    if case_insensitive:
+        data = data.lower()
+        kw_bytes = [kw.lower() for kw in kw_bytes]
+
+    occurrences = _keyword_occurrences(data, kw_bytes)
+    live = [i for i, c in enumerate(occurrences) if c]
+    if not live:
+        return LogParseResult(
+            file=str(log_path),
+            total_lines=_count_lines(buf),
+            matched_lines=0,
+            by_keyword=by_kw,
+            samples=[],
+        )
+
+    newlines = _newline_offsets(buf)
+    total = len(newlines) + (1 if len(buf) and buf[-1:] != b"\n" else 0)
+
+    live_bytes = [kw_bytes[i] for i in live]
+    live_capacity = sum(occurrences[i] for i in live)
+    if (
+        isinstance(buf, mmap.mmap)
+        and len(buf) >= _PARALLEL_MIN_BYTES
+        and (os.cpu_count() or 1) > 1
+        and not any(b"\n" in kw for kw in live_bytes)
+    ):
+        try:
+            hits = _scan_parallel(log_path, data, live_bytes, case_insensitive)
+        except Exception:
+            hits = _scan_buffer(data, live_bytes, live_capacity)
+    else:
+        hits = _scan_buffer(data, live_bytes, live_capacity)
+    hits = [(offset, live[kw_id]) for offset, kw_id in hits]
+
+    return _collapse_hits(
+        str(log_path), total, hits, newlines, keywords, max_samples,
+        lambda line_no: _line_text(buf, newlines, line_no, max_line_length),
+    )
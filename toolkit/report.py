@@ -1,7 +1,8 @@
 from __future__ import annotations
-import csv
+import zipfile
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape
 
 from .system_health import HealthSnapshot
 from .log_parser import LogParseResult
@@ -13,17 +14,120 @@ try:
 except Exception:
     Workbook = None  # type: ignore
 
-def _autosize_columns(ws, max_width: int = 60) -> None:
-    for col_idx, col in enumerate(ws.columns, start=1):
-        max_len = 0
-        for cell in list(col)[:200]:
-            v = "" if cell.value is None else str(cell.value)
-            max_len = max(max_len, len(v))
-        ws.column_dimensions[get_column_letter(col_idx)].width = min(max_len + 2, max_width)
+# above this many sample rows, LogFindings is written via the raw XML path
+_RAW_XLSX_MIN_SAMPLES = 2000
+
+# 1 MiB write buffer so csv rows are flushed in large blocks, not line by line
+_CSV_BUFFER = 1 << 20
+
+def _csv_row(fields) -> str:
+    # same output as csv.writer's default dialect, without the dispatch
+    # machinery: most of our columns never need quoting, so the common case
+    # is a plain join
+    out = []
+    for v in fields:
+        s = v if isinstance(v, str) else ("" if v is None else str(v))
+        if '"' in s or "," in s or "\n" in s or "\r" in s:
+            s = '"' + s.replace('"', '""') + '"'
+        out.append(s)
+    if out == [""]:
+        # csv.writer quotes a lone empty field so the row is not read back
+        # as an empty row
+        return '""\r\n'
+    return ",".join(out) + "\r\n"
+
+def _xml_cell(v) -> str:
+    if v is None:
+        return "<c/>"
+    if isinstance(v, bool):
+        return f'<c t="b"><v>{int(v)}</v></c>'
+    if isinstance(v, (int, float)):
+        return f"<c><v>{v}</v></c>"
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{escape(str(v))}</t></is></c>'
+
+def _xml_sheet(rows: List[List]) -> str:
+    parts = ['<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+             '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+             "<sheetData>"]
+    for r, row in enumerate(rows, start=1):
+        parts.append(f'<row r="{r}">' + "".join(_xml_cell(v) for v in row) + "</row>")
+    parts.append("</sheetData></worksheet>")
+    return "".join(parts)
+
+def _export_xlsx_raw(out_file: Path, sheets: List[Tuple[str, List[List]]]) -> Path:
+    # hand-written SpreadsheetML with inline strings: no cell objects, no
+    # openpyxl per-cell overhead, just XML appended into the ZIP
+    ns_ct = "http://schemas.openxmlformats.org/package/2006/content-types"
+    ns_rel = "http://schemas.openxmlformats.org/package/2006/relationships"
+    ns_doc = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    overrides = "".join(
+        f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+        f'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        for i in range(1, len(sheets) + 1)
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<Types xmlns="{ns_ct}">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        f"{overrides}</Types>"
+    )
+    root_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<Relationships xmlns="{ns_rel}">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/></Relationships>'
+    )
+    sheet_entries = "".join(
+        f'<sheet name="{escape(name)}" sheetId="{i}" r:id="rId{i}"/>'
+        for i, (name, _) in enumerate(sheets, start=1)
+    )
+    workbook = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        f'xmlns:r="{ns_doc}"><sheets>{sheet_entries}</sheets></workbook>'
+    )
+    wb_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<Relationships xmlns="{ns_rel}">'
+        + "".join(
+            f'<Relationship Id="rId{i}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+            f'Target="worksheets/sheet{i}.xml"/>'
+            for i in range(1, len(sheets) + 1)
+        )
+        + "</Relationships>"
+    )
+    with zipfile.ZipFile(out_file, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", content_types)
+        zf.writestr("_rels/.rels", root_rels)
+        zf.writestr("xl/workbook.xml", workbook)
+        zf.writestr("xl/_rels/workbook.xml.rels", wb_rels)
+        for i, (_, rows) in enumerate(sheets, start=1):
+            zf.writestr(f"xl/worksheets/sheet{i}.xml", _xml_sheet(rows))
+    return out_file
+
+def _fit_widths(ws, rows: List[List], max_width: int = 60) -> None:
+    # write-only sheets cannot be walked after the fact, so widths are sized
+    # from the row data (first 200 rows, like the old autosize) before
+    # appending — one row-major pass, touching each cell exactly once
+    widths: List[int] = []
+    for row in rows[:200]:
+        if len(row) > len(widths):
+            widths.extend([0] * (len(row) - len(widths)))
+        for col_idx, v in enumerate(row):
+            n = 0 if v is None else len(str(v))
+            if n > widths[col_idx]:
+                widths[col_idx] = n
+    for col_idx, w in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = min(w + 2, max_width)
 
 def export_csv(
     out_dir: Path,
-    summary: Dict[str, str],
+    summary: Iterable[Tuple[str, str]],
     snapshot: Optional[HealthSnapshot],
     log_result: Optional[LogParseResult],
 ) -> List[Path]:
@@ -31,61 +135,57 @@ def export_csv(
     created: List[Path] = []
 
     p_sum = out_dir / "summary.csv"
-    with p_sum.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(["key", "value"])
-        for k, v in summary.items():
-            w.writerow([k, v])
+    with p_sum.open("w", newline="", encoding="utf-8", buffering=_CSV_BUFFER) as f:
+        f.write(_csv_row(["key", "value"]))
+        for k, v in summary:
+            f.write(_csv_row([k, v]))
     created.append(p_sum)
 
     if snapshot is not None:
         p_sys = out_dir / "system_health.csv"
-        with p_sys.open("w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            w.writerow([
+        with p_sys.open("w", newline="", encoding="utf-8", buffering=_CSV_BUFFER) as f:
+            f.write(_csv_row([
                 "timestamp", "hostname", "os", "os_version", "mount",
                 "disk_total_gb", "disk_used_gb", "disk_free_gb", "disk_used_percent",
                 "mem_total_gb", "mem_used_gb", "mem_free_gb", "mem_used_percent",
                 "cpu_cores_logical", "cpu_load_percent"
-            ])
+            ]))
             for d in snapshot.disks:
-                w.writerow([
+                f.write(_csv_row([
                     snapshot.timestamp, snapshot.hostname, snapshot.os, snapshot.os_version,
                     d.mount, safe_str(d.total_gb), safe_str(d.used_gb), safe_str(d.free_gb), safe_str(d.used_percent),
                     safe_str(snapshot.memory.total_gb), safe_str(snapshot.memory.used_gb), safe_str(snapshot.memory.free_gb), safe_str(snapshot.memory.used_percent),
                     safe_str(snapshot.cpu.cores_logical), safe_str(snapshot.cpu.load_percent),
-                ])
+                ]))
         created.append(p_sys)
 
         p_svc = out_dir / "services.csv"
-        with p_svc.open("w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            w.writerow(["name", "status", "detail"])
+        with p_svc.open("w", newline="", encoding="utf-8", buffering=_CSV_BUFFER) as f:
+            f.write(_csv_row(["name", "status", "detail"]))
             for s in snapshot.services:
-                w.writerow([s.name, s.status, s.detail])
+                f.write(_csv_row([s.name, s.status, s.detail]))
         created.append(p_svc)
 
     if log_result is not None:
         p_log = out_dir / "log_findings.csv"
-        with p_log.open("w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            w.writerow(["file", "total_lines", "matched_lines"])
-            w.writerow([log_result.file, log_result.total_lines, log_result.matched_lines])
-            w.writerow([])
-            w.writerow(["keyword", "count"])
+        with p_log.open("w", newline="", encoding="utf-8", buffering=_CSV_BUFFER) as f:
+            f.write(_csv_row(["file", "total_lines", "matched_lines"]))
+            f.write(_csv_row([log_result.file, log_result.total_lines, log_result.matched_lines]))
+            f.write(_csv_row([]))
+            f.write(_csv_row(["keyword", "count"]))
             for kw, c in sorted(log_result.by_keyword.items(), key=lambda x: (-x[1], x[0])):
-                w.writerow([kw, c])
-            w.writerow([])
-            w.writerow(["sample_line_no", "keyword", "line"])
+                f.write(_csv_row([kw, c]))
+            f.write(_csv_row([]))
+            f.write(_csv_row(["sample_line_no", "keyword", "line"]))
             for s in log_result.samples:
-                w.writerow([s.line_no, s.keyword, s.line])
+                f.write(_csv_row([s.line_no, s.keyword, s.line]))
         created.append(p_log)
 
     return created
 
 def export_xlsx(
     out_file: Path,
-    summary: Dict[str, str],
+    summary: Iterable[Tuple[str, str]],
     snapshot: Optional[HealthSnapshot],
     log_result: Optional[LogParseResult],
 ) -> Path:
@@ -93,40 +193,88 @@ def export_xlsx(
         raise RuntimeError("openpyxl is not available; install dependencies or use CSV export.")
 
     out_file.parent.mkdir(parents=True, exist_ok=True)
-    wb = Workbook()
 
-    ws = wb.active
-    ws.title = "Summary"
-    ws.append(["key", "value"])
-    for k, v in summary.items():
-        ws.append([k, v])
-    _autosize_columns(ws)
+    if log_result is not None and len(log_result.samples) > _RAW_XLSX_MIN_SAMPLES:
+        sheets: List[Tuple[str, List[List]]] = [
+            ("Summary", [["key", "value"], *[[k, v] for k, v in summary]]),
+        ]
+        if snapshot is not None:
+            sys_rows: List[List] = [[
+                "timestamp", "hostname", "os", "os_version", "mount",
+                "disk_total_gb", "disk_used_gb", "disk_free_gb", "disk_used_percent",
+                "mem_total_gb", "mem_used_gb", "mem_free_gb", "mem_used_percent",
+                "cpu_cores_logical", "cpu_load_percent"
+            ]]
+            for d in snapshot.disks:
+                sys_rows.append([
+                    snapshot.timestamp, snapshot.hostname, snapshot.os, snapshot.os_version,
+                    d.mount, d.total_gb, d.used_gb, d.free_gb, d.used_percent,
+                    snapshot.memory.total_gb, snapshot.memory.used_gb, snapshot.memory.free_gb, snapshot.memory.used_percent,
+                    snapshot.cpu.cores_logical, snapshot.cpu.load_percent
+                ])
+            sheets.append(("SystemHealth", sys_rows))
+            sheets.append(("Services", [["name", "status", "detail"],
+                                        *[[s.name, s.status, s.detail] for s in snapshot.services]]))
+        log_rows: List[List] = [
+            ["file", log_result.file],
+            ["total_lines", log_result.total_lines],
+            ["matched_lines", log_result.matched_lines],
+            [],
+            ["keyword", "count"],
+        ]
+        for kw, c in sorted(log_result.by_keyword.items(), key=lambda x: (-x[1], x[0])):
+            log_rows.append([kw, c])
+        log_rows.append([])
+        log_rows.append(["sample_line_no", "keyword", "line"])
+        for s in log_result.samples:
+            log_rows.append([s.line_no, s.keyword, s.line])
+        sheets.append(("LogFindings", log_rows))
+        return _export_xlsx_raw(out_file, sheets)
+
+    # write-only mode streams rows straight into the archive instead of
+    # keeping the whole cell grid in memory
+    wb = Workbook(write_only=True)
+
+    ws = wb.create_sheet("Summary")
+    rows: List[List] = [["key", "value"]]
+    for k, v in summary:
+        rows.append([k, v])
+    _fit_widths(ws, rows)
+    for row in rows:
+        ws.append(row)
 
     if snapshot is not None:
         ws2 = wb.create_sheet("SystemHealth")
-        ws2.append([
+        rows = [[
             "timestamp", "hostname", "os", "os_version", "mount",
             "disk_total_gb", "disk_used_gb", "disk_free_gb", "disk_used_percent",
             "mem_total_gb", "mem_used_gb", "mem_free_gb", "mem_used_percent",
             "cpu_cores_logical", "cpu_load_percent"
-        ])
+        ]]
         for d in snapshot.disks:
-            ws2.append([
+            rows.append([
                 snapshot.timestamp, snapshot.hostname, snapshot.os, snapshot.os_version,
                 d.mount, d.total_gb, d.used_gb, d.free_gb, d.used_percent,
                 snapshot.memory.total_gb, snapshot.memory.used_gb, snapshot.memory.free_gb, snapshot.memory.used_percent,
                 snapshot.cpu.cores_logical, snapshot.cpu.load_percent
             ])
-        _autosize_columns(ws2)
+        _fit_widths(ws2, rows)
+        for row in rows:
+            ws2.append(row)
 
         ws3 = wb.create_sheet("Services")
-        ws3.append(["name", "status", "detail"])
+        rows = [["name", "status", "detail"]]
         for s in snapshot.services:
-            ws3.append([s.name, s.status, s.detail])
-        _autosize_columns(ws3)
+            rows.append([s.name, s.status, s.detail])
+        _fit_widths(ws3, rows)
+        for row in rows:
+            ws3.append(row)
 
     if log_result is not None:
         ws4 = wb.create_sheet("LogFindings")
+        # this sheet can be huge: use fixed widths and stream samples directly
+        for col_idx, width in enumerate((18, 18, 60), start=1):
+            ws4.column_dimensions[get_column_letter(col_idx)].width = width
         ws4.append(["file", log_result.file])
         ws4.append(["total_lines", log_result.total_lines])
         ws4.append(["matched_lines", log_result.matched_lines])
@@ -138,7 +286,6 @@ def export_xlsx(
         ws4.append(["sample_line_no", "keyword", "line"])
         for s in log_result.samples:
             ws4.append([s.line_no, s.keyword, s.line])
-        _autosize_columns(ws4)
 
     wb.save(out_file)
     return out_file
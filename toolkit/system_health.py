@@ -1,12 +1,18 @@
 from __future__ import annotations
+import hashlib
+import json
 import os
 import platform
 import shutil
 import subprocess
-from dataclasses import dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from .utils import cache_dir
 
 try:
     import psutil  # type: ignore
@@ -53,13 +59,38 @@ class HealthSnapshot:
 def _bytes_to_gb(b: float) -> float:
     return round(b / (1024 ** 3), 2)
 
+# the partition table almost never changes within a session, and usage moves
+# slowly; both psutil calls hit the filesystem, so reuse recent answers
+_PARTITIONS_TTL_SECONDS = 30.0
+_USAGE_TTL_SECONDS = 5.0
+_partitions_cache: Optional[Tuple[float, list]] = None
+_usage_cache: Dict[str, Tuple[float, object]] = {}
+
+def _disk_partitions() -> list:
+    global _partitions_cache
+    now = time.monotonic()
+    if _partitions_cache is not None and now - _partitions_cache[0] < _PARTITIONS_TTL_SECONDS:
+        return _partitions_cache[1]
+    parts = psutil.disk_partitions(all=False)
+    _partitions_cache = (now, parts)
+    return parts
+
+def _disk_usage(mountpoint: str):
+    now = time.monotonic()
+    cached = _usage_cache.get(mountpoint)
+    if cached is not None and now - cached[0] < _USAGE_TTL_SECONDS:
+        return cached[1]
+    usage = psutil.disk_usage(mountpoint)
+    _usage_cache[mountpoint] = (now, usage)
+    return usage
+
 def get_disks() -> List[DiskInfo]:
     disks: List[DiskInfo] = []
     if psutil is not None:
         try:
-            for part in psutil.disk_partitions(all=False):
+            for part in _disk_partitions():
                 try:
-                    usage = psutil.disk_usage(part.mountpoint)
+                    usage = _disk_usage(part.mountpoint)
                     disks.append(DiskInfo(
                         mount=part.mountpoint,
                         total_gb=_bytes_to_gb(usage.total),
@@ -102,19 +133,22 @@ def get_memory() -> MemoryInfo:
             pass
 
     try:
-        if Path("/proc/meminfo").exists():
-            data = Path("/proc/meminfo").read_text(encoding="utf-8", errors="ignore").splitlines()
-            kv = {}
-            for line in data:
-                if ":" in line:
-                    k, v = line.split(":", 1)
-                    kv[k.strip()] = v.strip()
-
+        meminfo = Path("/proc/meminfo")
+        if meminfo.exists():
+            # one binary read, split on raw bytes; only the two fields we use
+            # are parsed, and both sit in the first few lines
             def _kb_to_gb(kb: float) -> float:
                 return round((kb * 1024) / (1024 ** 3), 2)
 
-            mem_total_kb = float(kv.get("MemTotal", "0 kB").split()[0])
-            mem_avail_kb = float(kv.get("MemAvailable", "0 kB").split()[0])
+            mem_total_kb = 0.0
+            mem_avail_kb = 0.0
+            for line in meminfo.read_bytes().split(b"\n"):
+                if line.startswith(b"MemTotal:"):
+                    mem_total_kb = float(line.split()[1])
+                elif line.startswith(b"MemAvailable:"):
+                    mem_avail_kb = float(line.split()[1])
+                if mem_total_kb and mem_avail_kb:
+                    break
             total_gb = _kb_to_gb(mem_total_kb) if mem_total_kb else None
             free_gb = _kb_to_gb(mem_avail_kb) if mem_avail_kb else None
             used_gb = round(total_gb - free_gb, 2) if (total_gb is not None and free_gb is not None) else None
@@ -162,6 +196,25 @@ def check_services(service_names: List[str]) -> List[ServiceStatus]:
         return statuses
 
     if _has_systemctl():
+        # one batched invocation: systemctl prints one status per unit, in
+        # argument order, so N fork/execs collapse into a single one
+        try:
+            cp = subprocess.run(
+                ["systemctl", "is-active", *service_names],
+                capture_output=True,
+                text=True,
+                timeout=3 + len(service_names),
+            )
+            lines = (cp.stdout or "").splitlines()
+            if len(lines) == len(service_names):
+                for name, out in zip(service_names, lines):
+                    out = out.strip()
+                    statuses.append(ServiceStatus(name=name, status=out if out else "unknown"))
+                return statuses
+        except Exception:
+            pass
+        # batch output did not line up (or systemctl failed outright):
+        # fall back to the per-service probe to keep per-unit error detail
         for name in service_names:
             try:
                 cp = subprocess.run(
@@ -182,18 +235,82 @@ def check_services(service_names: List[str]) -> List[ServiceStatus]:
         statuses.append(ServiceStatus(name=name, status="unknown", detail="service check not supported on this OS"))
     return statuses
 
-def collect_health_snapshot(service_names: List[str]) -> HealthSnapshot:
+# snapshots are expensive (cpu_percent alone blocks 0.5s); reuse a recent one
+# when the same services are requested again within the TTL.  The CLI runs as
+# a fresh process per invocation, so the cache is also persisted to a small
+# file under the user cache directory — that is what makes back-to-back
+# `toolkit health` calls actually hit it.
+_SNAPSHOT_TTL_SECONDS = 5.0
+_snapshot_cache: Dict[Tuple[str, ...], Tuple[float, HealthSnapshot]] = {}
+
+def _snapshot_cache_file(key: Tuple[str, ...]) -> Path:
+    digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+    return cache_dir("health") / f"{digest}.json"
+
+def _snapshot_load(key: Tuple[str, ...], ttl: float) -> Optional[HealthSnapshot]:
+    try:
+        payload = json.loads(_snapshot_cache_file(key).read_text(encoding="utf-8"))
+        if time.time() - float(payload["saved_at"]) >= ttl:
+            return None
+        d = payload["snapshot"]
+        return HealthSnapshot(
+            timestamp=d["timestamp"],
+            hostname=d["hostname"],
+            os=d["os"],
+            os_version=d["os_version"],
+            disks=[DiskInfo(**x) for x in d["disks"]],
+            memory=MemoryInfo(**d["memory"]),
+            cpu=CPUInfo(**d["cpu"]),
+            services=[ServiceStatus(**x) for x in d["services"]],
+        )
+    except Exception:
+        # missing, stale, corrupt, or from an older schema: just recollect
+        return None
+
+def _snapshot_store(key: Tuple[str, ...], snapshot: HealthSnapshot) -> None:
+    try:
+        cache_file = _snapshot_cache_file(key)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"saved_at": time.time(), "snapshot": asdict(snapshot)}
+        # write-then-rename so concurrent readers see the old file or the new
+        # one, never a half-written snapshot
+        tmp = cache_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        tmp.replace(cache_file)
+    except Exception:
+        pass
+
+def collect_health_snapshot(service_names: List[str], *, ttl: float = _SNAPSHOT_TTL_SECONDS) -> HealthSnapshot:
+    key = tuple(service_names)
+    cached = _snapshot_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    snapshot = _snapshot_load(key, ttl) if ttl > 0 else None
+    if snapshot is None:
+        snapshot = _collect_health_snapshot(service_names)
+        _snapshot_store(key, snapshot)
+    _snapshot_cache[key] = (time.monotonic(), snapshot)
+    return snapshot
+
+def _collect_health_snapshot(service_names: List[str]) -> HealthSnapshot:
     now = datetime.now().isoformat(timespec="seconds")
     hostname = platform.node() or "unknown-host"
     os_name = platform.system() or "unknown"
     os_ver = platform.version() or platform.release() or "unknown"
-    return HealthSnapshot(
-        timestamp=now,
-        hostname=hostname,
-        os=os_name,
-        os_version=os_ver,
-        disks=get_disks(),
-        memory=get_memory(),
-        cpu=get_cpu(),
-        services=check_services(service_names),
-    )
+    # the probes block on I/O (statvfs, systemctl) or sleep (cpu_percent),
+    # so running them on threads overlaps their wait time
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        f_disks = ex.submit(get_disks)
+        f_memory = ex.submit(get_memory)
+        f_cpu = ex.submit(get_cpu)
+        f_services = ex.submit(check_services, service_names)
+        return HealthSnapshot(
+            timestamp=now,
+            hostname=hostname,
+            os=os_name,
+            os_version=os_ver,
+            disks=f_disks.result(),
+            memory=f_memory.result(),
+            cpu=f_cpu.result(),
+            services=f_services.result(),
+        )
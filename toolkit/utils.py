@@ -1,4 +1,5 @@
 from __future__ import annotations
+import os
 from pathlib import Path
 from typing import List, Optional
 
@@ -7,6 +8,12 @@ def ensure_dir(path: Path) -> Path:
     path.mkdir(parents=True, exist_ok=True)
     return path
 
+def cache_dir(name: str) -> Path:
+    """Per-feature cache directory under XDG_CACHE_HOME (default ~/.cache)."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "it-support-toolkit" / name
+
 def parse_csv_list(s: Optional[str]) -> List[str]:
     if not s:
         return []